@@ -1,17 +1,32 @@
 from pathlib import Path
-from ruamel.yaml import YAML, safe_load
+
+from ruamel.yaml import YAML
+
+from hpcflow.utils import read_JSON_cache, write_JSON_cache
 
 
 class Config:
 
     __conf = {}
+    __conf_dir = None  # resolved directory from which `__conf` was last loaded
 
     @staticmethod
     def get_config_file(config_dir):
+        """Load the config file. The parsed data is cached in a JSON file alongside the
+        config file, and is reused while the config file modification time and size are
+        unchanged."""
 
         config_file = config_dir.joinpath("config.yaml")
-        with config_file.open() as handle:
-            config_dat = safe_load(handle)
+        stat = config_file.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        is_cached, config_dat = read_JSON_cache(config_file, stat_key)
+        if is_cached:
+            return config_dat, config_file
+
+        yaml = YAML(typ="safe")  # uses the LibYAML-based parser where available
+        config_dat = yaml.load(config_file.read_text())
+        write_JSON_cache(config_file, stat_key, config_dat)
 
         return config_dat, config_file
 
@@ -30,10 +45,16 @@ class Config:
         return config_dir
 
     @staticmethod
-    def set_config(config_dir=None):
-        """Load configuration from a YAML file."""
+    def set_config(config_dir=None, reload=False):
+        """Load configuration from a YAML file. The file is loaded only once per
+        configuration directory within a process, unless `reload` is True."""
 
         config_dir = Config.resolve_config_dir(config_dir)
+        config_dir_resolved = config_dir.resolve()
+        if not reload and config_dir_resolved == Config.__conf_dir:
+            return
+
         config_dat, _ = Config.get_config_file(config_dir)
 
         Config.__conf.update(**config_dat)
+        Config.__conf_dir = config_dir_resolved
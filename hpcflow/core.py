@@ -1,8 +1,6 @@
 import datetime
 import enum
 
-import zarr
-
 from hpcflow.utils import make_workflow_id, get_time_stamp
 from hpcflow.config import Config
 
@@ -30,6 +28,8 @@ class TaskSchema:
 
 def make_workflow():
 
+    import zarr  # imported here to avoid the import cost when zarr is not needed
+
     Config.set_config()
 
     workflow = Workflow(
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 import click
 
@@ -6,6 +7,32 @@ from hpcflow.cli import cli
 from hpcflow.runtime import RunTimeInfo
 
 
+@lru_cache(maxsize=None)
+def _make_CLI(name, version):
+    """Generate the CLI for an application with a given name and version. The CLI is
+    cached, so that repeated instantiations of the same application share a CLI."""
+
+    def new_CLI(ctx, debug):
+        ctx.obj = RunTimeInfo(name=name, debug=debug)
+        if debug:
+            click.echo("Debug mode is ON.")
+            click.echo(f"run_time_info is: {ctx.obj!r}.")
+
+    new_CLI = click.version_option(package_name=name, prog_name=name, version=version)(
+        new_CLI
+    )
+    new_CLI = click.option("--debug/--no-debug", default=False)(new_CLI)
+    new_CLI = click.pass_context(new_CLI)
+    new_CLI = click.group(name=name)(new_CLI)
+
+    # add hpcflow CLI as a sub command:
+    new_CLI.add_command(cli)
+    for cmd_name, command in cli.commands.items():
+        # add each hpcflow command as a new CLI command:
+        new_CLI.add_command(command, name=cmd_name)
+    return new_CLI
+
+
 @dataclass
 class HPCFlow:
     """Class for instantiating an HPCFlow application, which may provide, for instance,
@@ -18,22 +45,4 @@ class HPCFlow:
         self.CLI = self.make_CLI()
 
     def make_CLI(self):
-        def new_CLI(ctx, debug):
-            ctx.obj = RunTimeInfo(name=self.name, debug=debug)
-            if debug:
-                click.echo("Debug mode is ON.")
-                click.echo(f"run_time_info is: {ctx.obj!r}.")
-
-        new_CLI = click.version_option(
-            package_name=self.name, prog_name=self.name, version=self.version
-        )(new_CLI)
-        new_CLI = click.option("--debug/--no-debug", default=False)(new_CLI)
-        new_CLI = click.pass_context(new_CLI)
-        new_CLI = click.group(name=self.name)(new_CLI)
-
-        # add hpcflow CLI as a sub command:
-        new_CLI.add_command(cli)
-        for name, command in cli.commands.items():
-            # add each hpcflow command as a new CLI command:
-            new_CLI.add_command(command, name=name)
-        return new_CLI
+        return _make_CLI(self.name, self.version)
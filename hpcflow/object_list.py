@@ -1,7 +1,11 @@
+from operator import attrgetter
+
+
 class DotAccessObjectList:
     def __init__(self, *objects, access_attribute, descriptor):
         self._objects = list(objects)
         self._access_attribute = access_attribute
+        self._get_access_attribute = attrgetter(access_attribute)
         self._descriptor = descriptor
 
         if self._objects:
@@ -32,14 +36,24 @@ class DotAccessObjectList:
     def __eq__(self, other):
         return self._objects == other
 
+    def __copy__(self):
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        obj._objects = list(self._objects)  # `add_object` modifies the list in place
+        return obj
+
     def __getattr__(self, attribute):
+        if attribute.startswith("_"):
+            # not an object name, but e.g. a special method looked up by Python, or a
+            # private attribute not yet set (as when copying or unpickling):
+            raise AttributeError(attribute)
+
+        get_access_attr = self._get_access_attribute
         for obj in self._objects:
-            if getattr(obj, self._access_attribute) == attribute:
+            if get_access_attr(obj) == attribute:
                 return obj
 
-        obj_list_fmt = ", ".join(
-            [f'"{getattr(i, self._access_attribute)}"' for i in self._objects]
-        )
+        obj_list_fmt = ", ".join(f'"{i}"' for i in map(get_access_attr, self._objects))
         msg = (
             f"{self._descriptor.title()} {attribute!r} does not exist. Available "
             f"{self._descriptor}s are: {obj_list_fmt}."
@@ -47,9 +61,7 @@ class DotAccessObjectList:
         raise AttributeError(msg)
 
     def __dir__(self):
-        return super().__dir__() + [
-            getattr(i, self._access_attribute) for i in self._objects
-        ]
+        return super().__dir__() + list(map(self._get_access_attribute, self._objects))
 
     def add_object(self, obj, index=-1):
         if not hasattr(obj, self._access_attribute):
@@ -58,7 +70,7 @@ class DotAccessObjectList:
             )
         if index < 0:
             index += len(self) + 1
-        self._objects = self._objects[:index] + [obj] + self._objects[index:]
+        self._objects.insert(index, obj)
 
 
 class TaskList(DotAccessObjectList):
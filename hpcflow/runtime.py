@@ -1,4 +1,3 @@
-from imp import is_frozen
 import os
 from pathlib import Path
 import sys
@@ -11,9 +10,6 @@ class RunTimeInfo:
     def __init__(self, name, debug=False):
 
         is_frozen = getattr(sys, "frozen", False)
-        bundle_dir = (
-            sys._MEIPASS if is_frozen else os.path.dirname(os.path.abspath(__file__))
-        )
 
         self.name = name
         self.debug = debug
@@ -24,7 +20,7 @@ class RunTimeInfo:
         path_argv = Path(sys.argv[0])
 
         if self.is_frozen:
-            self.bundle_dir = Path(bundle_dir)
+            self.bundle_dir = Path(sys._MEIPASS)
             self.executable_path = path_argv
             self.resolved_executable_path = path_exec
             self.executable_name = self.executable_path.name
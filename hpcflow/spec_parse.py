@@ -1,6 +1,9 @@
 """Module containing logic for parsing workflow spec files/strings."""
 
+import copy
+from functools import lru_cache
 from importlib import resources
+import os
 from pathlib import Path
 
 from ruamel.yaml import YAML
@@ -14,10 +17,34 @@ from hpcflow.errors import (
 )
 from hpcflow.parameters import Parameter, SchemaInput, SchemaOutput
 from hpcflow.task_schema import TaskSchema
+from hpcflow.utils import read_JSON_cache, write_JSON_cache
 from hpcflow.workflow import WorkflowTemplate
 from hpcflow.environment import Executable, ExecutableInstance, Environment
 
 
+@lru_cache(maxsize=None)
+def _load_builtin_YAML_data(file_name):
+    """Load a YAML data file within `hpcflow.data`, caching the parsed data."""
+    with resources.open_text("hpcflow.data", file_name) as fh:
+        yaml_str = fh.read()
+    yaml = YAML(typ="safe")
+    return yaml.load(yaml_str)
+
+
+def _get_builtin_YAML_data(file_name):
+    """Get the parsed contents of a YAML data file within `hpcflow.data`, reading and
+    parsing the file only on first access within this process.
+
+    Returns
+    -------
+    dat
+        A copy of the parsed data, which may be freely modified.
+
+    """
+    return copy.deepcopy(_load_builtin_YAML_data(file_name))
+
+
+@lru_cache(maxsize=None)
 def get_workflow_spec_schema():
     with resources.open_text("hpcflow.data", "workflow_spec_schema.yaml") as fh:
         schema_dat = fh.read()
@@ -25,6 +52,7 @@ def get_workflow_spec_schema():
     return schema
 
 
+@lru_cache(maxsize=None)
 def get_task_schema_spec_schema():
     with resources.open_text("hpcflow.data", "task_schema_spec_schema.yaml") as fh:
         schema_dat = fh.read()
@@ -32,6 +60,7 @@ def get_task_schema_spec_schema():
     return schema
 
 
+@lru_cache(maxsize=None)
 def get_environment_spec_schema():
     with resources.open_text("hpcflow.data", "environments_spec_schema.yaml") as fh:
         schema_dat = fh.read()
@@ -40,11 +69,7 @@ def get_environment_spec_schema():
 
 
 def get_task_schemas_and_parameters():
-    with resources.open_text("hpcflow.data", "task_schemas.yaml") as fh:
-        yaml_str = fh.read()
-
-    yaml = YAML(typ="safe")
-    task_schemas_dat = yaml.load(yaml_str)
+    task_schemas_dat = _get_builtin_YAML_data("task_schemas.yaml")
 
     task_schemas_spec_schema = get_task_schema_spec_schema()
     validated = task_schemas_spec_schema.validate(task_schemas_dat)
@@ -71,11 +96,7 @@ def get_task_schemas_and_parameters():
 
 
 def get_environments():
-    with resources.open_text("hpcflow.data", "environments.yaml") as fh:
-        yaml_str = fh.read()
-
-    yaml = YAML(typ="safe")
-    envs_dat = yaml.load(yaml_str)
+    envs_dat = _get_builtin_YAML_data("environments.yaml")
 
     env_spec_schema = get_environment_spec_schema()
     validated = env_spec_schema.validate(envs_dat)
@@ -86,17 +107,67 @@ def get_environments():
     return envs
 
 
+@lru_cache(maxsize=128)
+def _load_YAML_file(path, mtime_ns, size, use_JSON_cache):
+    """Load a YAML file, caching the parsed data. The file modification time and size are
+    included in the arguments so that the cache is invalidated when the file changes.
+
+    If `use_JSON_cache` is True, the parsed data is additionally cached in a JSON file
+    alongside the YAML file, which is loaded in preference to the YAML file (in this and
+    other processes) if it was generated from a YAML file with the same modification time
+    and size."""
+
+    stat_key = (mtime_ns, size)
+    if use_JSON_cache:
+        is_cached, dat = read_JSON_cache(path, stat_key)
+        if is_cached:
+            return dat
+
+    yaml = YAML(typ="safe")
+    dat = yaml.load(Path(path).read_text())
+
+    if use_JSON_cache:
+        write_JSON_cache(path, stat_key, dat)
+
+    return dat
+
+
+def load_YAML_file(yaml_file):
+    """Load a YAML file, re-parsing only if the file has changed since it was last loaded
+    in this process.
+
+    If the environment variable `HPCFLOW_SPEC_CACHE` is set to "1", the parsed data is
+    additionally cached in a JSON file alongside the YAML file, which is reused in other
+    processes while the YAML file modification time and size are unchanged.
+
+    Returns
+    -------
+    dat
+        A copy of the (possibly cached) parsed data, which may be freely modified.
+
+    """
+    path = Path(yaml_file).resolve()
+    stat = os.stat(path)
+    use_JSON_cache = os.environ.get("HPCFLOW_SPEC_CACHE") == "1"
+    return copy.deepcopy(
+        _load_YAML_file(str(path), stat.st_mtime_ns, stat.st_size, use_JSON_cache)
+    )
+
+
 def parse_YAML_spec_file(yaml_file):
-    """Generate a WorkflowTemplate from a YAML string."""
-    with Path(yaml_file).open("r") as fh:
-        yaml_str = fh.read()
-    return parse_YAML_spec_str(yaml_str)
+    """Generate a WorkflowTemplate from a YAML file."""
+    return _parse_workflow_dat(load_YAML_file(yaml_file))
 
 
 def parse_YAML_spec_str(yaml_str):
     """Generate a WorkflowTemplate from a YAML string."""
     yaml = YAML(typ="safe")
     workflow_dat = yaml.load(yaml_str)
+    return _parse_workflow_dat(workflow_dat)
+
+
+def _parse_workflow_dat(workflow_dat):
+    """Generate a WorkflowTemplate from parsed workflow spec data."""
     validated = get_workflow_spec_schema().validate(workflow_dat)
 
     if not validated.is_valid:
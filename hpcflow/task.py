@@ -120,17 +120,18 @@ class TaskTemplate:
         self._defined_input_types = set(input_types)
 
     def _get_name(self):
-        out = f"{self.objective.name}"
+        parts = [self.objective.name]
+        num_schemas = len(self.schemas)
         for idx, schema_i in enumerate(self.schemas, start=1):
-            need_and = idx < len(self.schemas) and (
+            if schema_i.method:
+                parts.append(f"_{schema_i.method}")
+            if schema_i.implementation:
+                parts.append(f"_{schema_i.implementation}")
+            if idx < num_schemas and (
                 self.schemas[idx].method or self.schemas[idx].implementation
-            )
-            out += (
-                f"{f'_{schema_i.method}' if schema_i.method else ''}"
-                f"{f'_{schema_i.implementation}' if schema_i.implementation else ''}"
-                f"{f'_and' if need_and else ''}"
-            )
-        return out
+            ):
+                parts.append("_and")
+        return "".join(parts)
 
     @classmethod
     def from_spec(cls, spec, all_schemas, all_parameters):
@@ -296,11 +297,12 @@ class TaskTemplate:
 
     @property
     def undefined_inputs(self):
+        undefined_types = self.undefined_input_types
         return [
             inp_j
             for schema_i in self.schemas
             for inp_j in schema_i.inputs
-            if inp_j.typ in self.undefined_input_types
+            if inp_j.typ in undefined_types
         ]
 
     @property
@@ -407,8 +409,12 @@ class Task:
     def index(self):
         """Zero-based position within the workflow. Uses initial index if appending to the
         workflow is not complete."""
+        tasks = self.workflow.tasks
+        if self._initial_index < len(tasks) and tasks[self._initial_index] is self:
+            # avoid searching the task list if this task has not moved:
+            return self._initial_index
         try:
-            return index(self.workflow.tasks, self)
+            return index(tasks, self)
         except ValueError:
             return self._initial_index
 
@@ -1,8 +1,11 @@
+import json
 import keyword
+import os
 from pathlib import Path
 import random
 import re
 import string
+import tempfile
 from datetime import datetime, timezone
 from typing import Mapping
 
@@ -32,11 +35,11 @@ def get_duplicate_items(lst):
     []
 
     >>> get_duplicate_items([1, 2, 3, 3, 3, 2])
-    [2, 3, 2]
+    [2, 3]
 
     """
-    seen = []
-    return list(set(x for x in lst if x in seen or seen.append(x)))
+    seen = set()
+    return list({x for x in lst if x in seen or seen.add(x)})
 
 
 def check_valid_py_identifier(name):
@@ -89,23 +92,23 @@ def group_by_dict_key_values(lst, *keys):
 
     """
 
-    grouped = [[lst[0]]]
-    for lst_item in lst[1:]:
-        for group_idx, group in enumerate(grouped):
+    grouped = []
+    grouped_key_vals = []  # values of `keys` for the items in each group
+    for lst_item in lst:
 
-            try:
-                is_vals_equal = all(lst_item[k] == group[0][k] for k in keys)
+        try:
+            key_vals = tuple(lst_item[k] for k in keys)
+        except KeyError:
+            # dicts that do not have all `keys` will be in their own group:
+            key_vals = None
 
-            except KeyError:
-                # dicts that do not have all `keys` will be in their own group:
-                is_vals_equal = False
-
-            if is_vals_equal:
+        for group_idx, group_key_vals in enumerate(grouped_key_vals):
+            if key_vals is not None and key_vals == group_key_vals:
                 grouped[group_idx].append(lst_item)
                 break
-
-        if not is_vals_equal:
+        else:
             grouped.append([lst_item])
+            grouped_key_vals.append(key_vals)
 
     return grouped
 
@@ -194,6 +197,69 @@ def search_dir_files_by_regex(pattern, group=0, directory="."):
     return vals
 
 
+def write_bytes_atomic(path, data):
+    """Write bytes to a file via a uniquely-named temporary file in the same directory,
+    which then replaces the target file, so that concurrent readers and writers never see
+    a partially-written file."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def get_JSON_cache_path(path):
+    """Get the path of the JSON cache file for a given source file."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.json")
+
+
+def read_JSON_cache(path, stat_key):
+    """Read data cached by `write_JSON_cache` for a given source file.
+
+    Returns
+    -------
+    tuple of (bool, object)
+        Whether valid cached data was found for exactly this `stat_key` (e.g. the source
+        file modification time and size), and the cached data (or None).
+
+    """
+    try:
+        payload = json.loads(get_JSON_cache_path(path).read_bytes())
+        if payload["stat_key"] == list(stat_key):
+            return True, payload["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # missing or invalid cache file
+    return False, None
+
+
+def write_JSON_cache(path, stat_key, dat):
+    """Write data parsed from a source file, along with a `stat_key` (e.g. the source file
+    modification time and size), to a JSON file alongside the source file, if the data
+    can be represented in JSON without modification."""
+    payload = {"stat_key": list(stat_key), "data": dat}
+    try:
+        json_bytes = json.dumps(payload).encode()
+    except (TypeError, ValueError):
+        return
+    if json.loads(json_bytes) != payload:
+        return  # e.g. non-string mapping keys
+
+    try:
+        write_bytes_atomic(get_JSON_cache_path(path), json_bytes)
+    except OSError:
+        pass  # e.g. a read-only directory; the cache is optional
+
+
 class classproperty(object):
     def __init__(self, f):
         self.f = f
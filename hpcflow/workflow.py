@@ -32,6 +32,7 @@ class WorkflowTemplate:
         self.tasks = TaskList()
         self.element_indices = []
         self.name_repeat_indices = []
+        self._task_name_counts = {}  # number of added tasks with each template name
 
         for task_template in task_templates or []:
             self.add_task(task_template)
@@ -134,8 +135,6 @@ class WorkflowTemplate:
         )  # modifies task_template.input_sources
         # at this point the source for each input should be decided and well-defined.
 
-        element_indices = []
-
         add_sequences = [  # treat the base inputs and resources as single-item sequences:
             ValueSequence(
                 path=["inputs"],
@@ -198,33 +197,34 @@ class WorkflowTemplate:
                 self.parameter_mapping.append(out_param_map)
                 output_map_indices[output.typ] = next_map_idx
 
-        for i_idx, i in enumerate(init_multi):
-            element_indices.append(len(self.elements))
-            self.elements.append(
-                {
-                    "inputs": [
-                        {
-                            "path": k,
-                            "parameter_mapping_index": input_map_indices[tuple(k)],
-                            "data_index": v,
-                        }
-                        for k, v in i["value_index"].items()
-                    ],
-                    "outputs": [
-                        {
-                            "path": ("outputs", k),
-                            "parameter_mapping_index": v,
-                            "data_index": i_idx,
-                        }
-                        for k, v in output_map_indices.items()
-                    ],
-                }
-            )
-
-        self.element_indices.append(element_indices)
-        self.name_repeat_indices.append(
-            sum(i.template.name == task_template.name for i in self.tasks) + 1
+        # add all new elements at once:
+        first_elem_idx = len(self.elements)
+        self.elements.extend(
+            {
+                "inputs": [
+                    {
+                        "path": k,
+                        "parameter_mapping_index": input_map_indices[tuple(k)],
+                        "data_index": v,
+                    }
+                    for k, v in i["value_index"].items()
+                ],
+                "outputs": [
+                    {
+                        "path": ("outputs", k),
+                        "parameter_mapping_index": v,
+                        "data_index": i_idx,
+                    }
+                    for k, v in output_map_indices.items()
+                ],
+            }
+            for i_idx, i in enumerate(init_multi)
         )
+
+        self.element_indices.append(list(range(first_elem_idx, len(self.elements))))
+        name_count = self._task_name_counts.get(task_template.name, 0) + 1
+        self._task_name_counts[task_template.name] = name_count
+        self.name_repeat_indices.append(name_count)
         task = Task(task_template, self, len(self.tasks))
         self.tasks.add_object(task)
 
@@ -283,15 +283,15 @@ class WorkflowTemplate:
     def get_input_values(self, task_index, parameter_path):
         """Get the value of an input for each element in a task."""
         return [
-            self.get_input_value(
-                task_index=task_index, element_index=i, parameter_path=parameter_path
-            )
-            for i in range(self.tasks[task_index].num_elements)
+            self._get_element_input_value(self.elements[i], parameter_path)
+            for i in self.tasks[task_index].element_indices
         ]
 
     def get_input_value(self, task_index, element_index, parameter_path):
-
         element = self.elements[self.tasks[task_index].element_indices[element_index]]
+        return self._get_element_input_value(element, parameter_path)
+
+    def _get_element_input_value(self, element, parameter_path):
         current_value = None
         for input_i in element["inputs"]:
 
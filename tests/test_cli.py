@@ -2,7 +2,7 @@ import pytest
 
 from click.testing import CliRunner
 
-from hpcflow import __version__
+from hpcflow import __version__, HPCFlow
 from hpcflow.cli import cli
 
 
@@ -10,3 +10,16 @@ def test_version():
     runner = CliRunner()
     result = runner.invoke(cli, args="--version")
     assert result.output.strip() == f"hpcflow, version {__version__}"
+
+
+def test_app_CLI_version():
+    app = HPCFlow(name="my_app", version="1.2.3")
+    runner = CliRunner()
+    result = runner.invoke(app.CLI, args="--version")
+    assert result.output.strip() == "my_app, version 1.2.3"
+
+
+def test_app_CLI_reused_for_same_name_and_version():
+    app_1 = HPCFlow(name="my_app", version="1.2.3")
+    app_2 = HPCFlow(name="my_app", version="1.2.3")
+    assert app_1.CLI is app_2.CLI
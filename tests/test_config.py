@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from hpcflow.config import Config
+
+
+@pytest.fixture
+def count_config_loads(monkeypatch):
+    """Reset the loaded config state, and count calls to `Config.get_config_file`."""
+    monkeypatch.setattr(Config, "_Config__conf", {})
+    monkeypatch.setattr(Config, "_Config__conf_dir", None)
+    loaded_dirs = []
+    get_config_file = Config.get_config_file
+
+    def get_config_file_counted(config_dir):
+        loaded_dirs.append(config_dir)
+        return get_config_file(config_dir)
+
+    monkeypatch.setattr(
+        Config, "get_config_file", staticmethod(get_config_file_counted)
+    )
+    return loaded_dirs
+
+
+def test_get_config_file_writes_cache(tmp_path):
+    tmp_path.joinpath("config.yaml").write_text("machine: laptop\n")
+    config_dat, _ = Config.get_config_file(tmp_path)
+    assert config_dat == {"machine": "laptop"}
+    assert tmp_path.joinpath(".config.yaml.json").is_file()
+    assert Config.get_config_file(tmp_path)[0] == {"machine": "laptop"}
+
+
+def test_get_config_file_cache_invalidated_on_modification(tmp_path):
+    config_file = tmp_path.joinpath("config.yaml")
+    config_file.write_text("machine: laptop\n")
+    Config.get_config_file(tmp_path)
+    config_file.write_text("machine: cluster\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert Config.get_config_file(tmp_path)[0] == {"machine": "cluster"}
+
+
+def test_get_config_file_cache_ignored_for_different_stat_key(tmp_path):
+    config_file = tmp_path.joinpath("config.yaml")
+    config_file.write_text("machine: laptop\n")
+    tmp_path.joinpath(".config.yaml.json").write_text(
+        '{"stat_key": [0, 0], "data": {"machine": "cluster"}}'
+    )
+    assert Config.get_config_file(tmp_path)[0] == {"machine": "laptop"}
+
+
+def test_set_config_loads_once_per_dir(tmp_path, count_config_loads):
+    tmp_path.joinpath("config.yaml").write_text("machine: laptop\n")
+    Config.set_config(tmp_path)
+    Config.set_config(tmp_path)
+    assert len(count_config_loads) == 1
+
+
+def test_set_config_reload(tmp_path, count_config_loads):
+    tmp_path.joinpath("config.yaml").write_text("machine: laptop\n")
+    Config.set_config(tmp_path)
+    Config.set_config(tmp_path, reload=True)
+    assert len(count_config_loads) == 2
+
+
+def test_set_config_loads_new_dir(tmp_path, count_config_loads):
+    for name in ("a", "b"):
+        tmp_path.joinpath(name).mkdir()
+        tmp_path.joinpath(name, "config.yaml").write_text("machine: laptop\n")
+        Config.set_config(tmp_path.joinpath(name))
+    assert len(count_config_loads) == 2
@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 
 import pytest
@@ -57,3 +58,19 @@ def test_add_obj_to_middle(simple_object_list):
     new_obj = MyObj("C", 3)
     obj_list.add_object(new_obj, 1)
     assert obj_list[1] == new_obj
+
+
+def test_copy(simple_object_list):
+    obj_list = simple_object_list["object_list"]
+    obj_list_copy = copy.copy(obj_list)
+    assert obj_list_copy.A == obj_list.A
+    obj_list_copy.add_object(MyObj("C", 3))
+    assert len(obj_list_copy) == 3 and len(obj_list) == 2
+
+
+def test_copy_unaffected_by_adding_to_original(simple_object_list):
+    obj_list = simple_object_list["object_list"]
+    obj_list_copy = copy.copy(obj_list)
+    obj_list.add_object(MyObj("C", 3), 0)
+    assert obj_list_copy == simple_object_list["objects"]
+    assert obj_list[0].name == "C"
@@ -0,0 +1,59 @@
+import os
+
+from hpcflow.spec_parse import load_YAML_file
+
+
+def test_load_YAML_file_returns_independent_copies(tmp_path):
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("tasks:\n  - objective: a\n")
+    dat_1 = load_YAML_file(yaml_file)
+    dat_1["tasks"].pop()
+    dat_2 = load_YAML_file(yaml_file)
+    assert dat_2 == {"tasks": [{"objective": "a"}]}
+
+
+def test_load_YAML_file_reparse_on_modification(tmp_path):
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("a: 1\n")
+    assert load_YAML_file(yaml_file) == {"a": 1}
+    yaml_file.write_text("a: 22\n")
+    stat = yaml_file.stat()
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_YAML_file(yaml_file) == {"a": 22}
+
+
+def test_load_YAML_file_JSON_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HPCFLOW_SPEC_CACHE", "1")
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("a: [1, 2]\n")
+    assert load_YAML_file(yaml_file) == {"a": [1, 2]}
+    assert tmp_path.joinpath(".spec.yaml.json").is_file()
+
+
+def test_load_YAML_file_no_JSON_cache_for_non_string_keys(tmp_path, monkeypatch):
+    monkeypatch.setenv("HPCFLOW_SPEC_CACHE", "1")
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("1: a\n")
+    assert load_YAML_file(yaml_file) == {1: "a"}
+    assert not tmp_path.joinpath(".spec.yaml.json").exists()
+
+
+def test_load_YAML_file_JSON_cache_ignored_for_older_replacement(tmp_path, monkeypatch):
+    monkeypatch.setenv("HPCFLOW_SPEC_CACHE", "1")
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("a: 1\n")
+    assert load_YAML_file(yaml_file) == {"a": 1}
+    # replace with a file that has an older modification time (e.g. `cp -p`):
+    stat = yaml_file.stat()
+    yaml_file.write_text("a: 2\n")
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+    assert load_YAML_file(yaml_file) == {"a": 2}
+
+
+def test_load_YAML_file_JSON_cache_enabled_after_first_load(tmp_path, monkeypatch):
+    yaml_file = tmp_path.joinpath("spec.yaml")
+    yaml_file.write_text("a: 1\n")
+    load_YAML_file(yaml_file)
+    monkeypatch.setenv("HPCFLOW_SPEC_CACHE", "1")
+    load_YAML_file(yaml_file)
+    assert tmp_path.joinpath(".spec.yaml.json").is_file()
@@ -4,6 +4,8 @@ from hpcflow.utils import (
     get_duplicate_items,
     check_valid_py_identifier,
     group_by_dict_key_values,
+    search_dir_files_by_regex,
+    write_bytes_atomic,
 )
 
 
@@ -113,6 +115,10 @@ def test_expected_return_group_by_dict_key_values_multi_key_items_multi_key_pass
     ]
 
 
+def test_expected_return_group_by_dict_key_values_empty_list():
+    assert group_by_dict_key_values([], "a") == []
+
+
 def test_expected_return_group_by_dict_key_values_excluded_items_for_missing_keys_first_item():
     item_1 = {"a": 9}
     item_2 = {"a": 9, "b": 1}
@@ -131,3 +137,21 @@ def test_expected_return_group_by_dict_key_values_excluded_items_for_missing_key
         [item_1, item_3],
         [item_2],
     ]
+
+
+def test_search_dir_files_by_regex_finds_new_files(tmp_path):
+    tmp_path.joinpath("out_1.txt").touch()
+    assert search_dir_files_by_regex(r"out_(\d+)", directory=tmp_path) == ["1"]
+    tmp_path.joinpath("out_2.txt").touch()
+    assert sorted(search_dir_files_by_regex(r"out_(\d+)", directory=tmp_path)) == [
+        "1",
+        "2",
+    ]
+
+
+def test_write_bytes_atomic(tmp_path):
+    path = tmp_path.joinpath("out.bin")
+    path.write_bytes(b"old")
+    write_bytes_atomic(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert [i.name for i in tmp_path.iterdir()] == ["out.bin"]